@@ -5,21 +5,131 @@
 """
 
 import yaml
+try:
+    # libyaml バインディングがあれば C 実装のパーサ/エミッタを使う（10倍以上速い）
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 import os
 import sys
 import argparse
 import re
 import platform
+import shutil
+import struct
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from PIL import Image as _PILImage
+except ImportError:
+    _PILImage = None
+
+# ゲームID生成用: 空白（全角含む）→ハイフン置換と許可外文字の除去
+_SPACE_TABLE = str.maketrans({' ': '-', '　': '-'})
+_ID_SANITIZE_RE = re.compile(r'[^a-z0-9-]')
+
+def _fast_image_info(path_str):
+    """画像ヘッダだけを読んで (width, height) を返す
+
+    JPEG は SOF マーカー、PNG は IHDR チャンクを直接パースするため
+    ピクセルのデコードもサブプロセス起動も発生しない。
+    解釈できない形式は Pillow があればそちらで試し、だめなら None。
+    """
+    try:
+        with open(path_str, 'rb') as f:
+            head = f.read(26)
+
+            if head.startswith(b'\x89PNG\r\n\x1a\n'):
+                width, height = struct.unpack('>II', head[16:24])
+                return width, height
+
+            if head.startswith(b'\xff\xd8'):  # JPEG
+                f.seek(2)
+                while True:
+                    marker = f.read(2)
+                    if len(marker) < 2 or marker[0] != 0xFF:
+                        break
+                    # SOF0〜SOF3 にサイズ情報が入っている
+                    if marker[1] in (0xC0, 0xC1, 0xC2, 0xC3):
+                        segment = f.read(7)
+                        height, width = struct.unpack('>HH', segment[3:7])
+                        return width, height
+                    length = struct.unpack('>H', f.read(2))[0]
+                    f.seek(length - 2, 1)
+    except (OSError, struct.error):
+        return None
+
+    if _PILImage is not None:
+        try:
+            with _PILImage.open(path_str) as img:
+                return img.size
+        except Exception:
+            pass
+
+    return None
+
+@lru_cache(maxsize=512)
+def _identify(path_str, mtime_ns, size):
+    """画像情報をキャッシュ付きで取得
+
+    まずヘッダパースで寸法を読み、だめな場合のみ magick identify に
+    フォールバックする。キーに更新時刻とサイズを含めるため、最適化
+    などでファイルが書き換わると自動的にキャッシュミスして再取得される。
+    """
+    dims = _fast_image_info(path_str)
+    if dims is not None:
+        return {
+            'width': dims[0],
+            'height': dims[1],
+            'file_size_str': f'{size}B',
+            'file_size': size
+        }
+
+    try:
+        cmd = ['magick', 'identify', '-format', '%w %h %b', path_str]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+
+        if result.returncode == 0:
+            parts = result.stdout.strip().split()
+            return {
+                'width': int(parts[0]),
+                'height': int(parts[1]),
+                'file_size_str': parts[2],
+                'file_size': size
+            }
+    except (subprocess.TimeoutExpired, ValueError, IndexError):
+        pass
+
+    # フォールバック: ファイルサイズのみ
+    return {
+        'width': 0,
+        'height': 0,
+        'file_size_str': 'unknown',
+        'file_size': size
+    }
+
 class ImageOptimizer:
+    # 常駐 magick プロセスとの応答同期用の番兵文字列
+    _SCRIPT_SENTINEL = '===MAGICK-DONE==='
+
     def __init__(self, project_root):
         self.project_root = Path(project_root)
         self.images_dir = self.project_root / "docs" / "assets" / "images"
         self.backup_dir = self.images_dir / "backup"
         self.is_windows = platform.system() == "Windows"
+        self._print_lock = threading.Lock()
+        self._magick_ok = None  # ensure_imagemagick の結果キャッシュ
+        self._script_proc = None  # 常駐 magick -script プロセス（False は起動不可）
+        self._script_lock = threading.Lock()
+        # 最適化不要と確認済みの (path, mtime_ns, size)。同一セッション内の
+        # 「すべて最適化」再実行で再プローブしないためのキャッシュ
+        self._recently_checked_ok = set()
         
         # 最適化設定
         self.settings = {
@@ -30,143 +140,335 @@ class ImageOptimizer:
             'preserve_original': True,
             'auto_optimize': True
         }
-        
+
+        # 設定から導かれる定数はループ内で毎回計算しない
+        self._max_file_size = self.settings['max_file_size']
+        self._max_width = int(self.settings['width'] * 1.2)
+        self._max_height = int(self.settings['height'] * 1.2)
+        self._target_ratio = self.settings['width'] / self.settings['height']  # 3:4 = 0.75
+
     def ensure_imagemagick(self):
-        """ImageMagickがインストールされているかチェック"""
-        try:
-            result = subprocess.run(['magick', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        """ImageMagickがインストールされているかチェック（結果は初回のみ取得）"""
+        if self._magick_ok is None:
+            try:
+                # returncode しか見ないので出力は捨てる（デコードコストもなし）
+                result = subprocess.run(['magick', '--version'],
+                                      stdout=subprocess.DEVNULL,
+                                      stderr=subprocess.DEVNULL, timeout=10)
+                self._magick_ok = result.returncode == 0
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                self._magick_ok = False
+        return self._magick_ok
     
-    def print_safe(self, text):
-        """Windows環境での安全な出力"""
+    def _decode_defines(self, image_path):
+        """拡張子に応じてデコードを軽くする -define 引数を返す
+
+        JPEG は libjpeg の DCT ドメイン縮小でピクセルデコード自体を
+        省略できる（目標サイズの2倍を指定して品質を確保）。
+        """
+        ext = os.path.splitext(str(image_path))[1].lower()
+        if ext in ('.jpg', '.jpeg'):
+            width = self.settings['width'] * 2
+            height = self.settings['height'] * 2
+            return ['-define', f'jpeg:size={width}x{height}']
+        if ext == '.png':
+            return ['-define', 'png:preserve-iCCP=false']
+        return []
+
+    def _get_script_proc(self):
+        """常駐の magick -script プロセスを返す（利用できない場合は None）
+
+        起動は1回だけ行い、以降の変換は同じプロセスに流し込むことで
+        ファイルごとのプロセス起動コストをなくす。
+        """
+        if self._script_proc is False:
+            return None
+
+        if self._script_proc is None:
+            try:
+                self._script_proc = subprocess.Popen(
+                    ['magick', '-script', '-'],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1
+                )
+            except OSError:
+                self._script_proc = False
+                return None
+
+        return self._script_proc
+
+    def _close_script_proc(self):
+        """常駐 magick プロセスを終了"""
+        proc = self._script_proc
+        if proc not in (None, False):
+            try:
+                proc.stdin.close()
+                proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                proc.kill()
+        self._script_proc = None
+
+    def close(self):
+        """保持している外部リソースを解放"""
+        self._close_script_proc()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
         try:
-            print(text)
-        except UnicodeEncodeError:
-            safe_text = text.replace('🖼️', '[IMG]').replace('✅', '[OK]').replace('❌', '[ERROR]')
-            print(safe_text)
-    
+            self._close_script_proc()
+        except Exception:
+            pass
+
+    def _script_convert(self, image_path, temp_path):
+        """常駐プロセス経由で1件変換する
+
+        成功/失敗を bool で返す。常駐プロセスが使えない環境では None を
+        返し、呼び出し元が従来の subprocess.run にフォールバックする。
+        """
+        with self._script_lock:
+            proc = self._get_script_proc()
+            if proc is None:
+                return None
+
+            try:
+                defines = ' '.join(self._decode_defines(image_path))
+                script = (
+                    f'{defines + " " if defines else ""}'
+                    f'-read "{image_path}" -auto-orient -strip '
+                    f'-resize "{self.settings["width"]}x{self.settings["height"]}>" '
+                    f'-quality {self.settings["quality"]} '
+                    f'-write "{temp_path}" -delete 0--1\n'
+                    f'-read xc:white -format "{self._SCRIPT_SENTINEL}\\n" '
+                    f'-identify -delete 0--1\n'
+                )
+                proc.stdin.write(script)
+                proc.stdin.flush()
+
+                while True:
+                    line = proc.stdout.readline()
+                    if not line:
+                        # プロセスが落ちた → 次回以降は都度起動に切り替え
+                        self._close_script_proc()
+                        self._script_proc = False
+                        return None
+                    if self._SCRIPT_SENTINEL in line:
+                        break
+            except OSError:
+                self._close_script_proc()
+                self._script_proc = False
+                return None
+
+        return os.path.exists(temp_path)
+
+    def print_safe(self, text):
+        """Windows環境での安全な出力（並列実行時の混線防止ロック付き）"""
+        with self._print_lock:
+            try:
+                print(text)
+            except UnicodeEncodeError:
+                safe_text = text.replace('🖼️', '[IMG]').replace('✅', '[OK]').replace('❌', '[ERROR]')
+                print(safe_text)
+
     def get_image_info(self, image_path):
-        """画像の詳細情報を取得"""
-        try:
-            cmd = ['magick', 'identify', '-format', '%w %h %b', str(image_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0:
-                parts = result.stdout.strip().split()
-                return {
-                    'width': int(parts[0]),
-                    'height': int(parts[1]),
-                    'file_size_str': parts[2],
-                    'file_size': os.path.getsize(image_path)
+        """画像の詳細情報を取得（同一ファイルへの再問い合わせはキャッシュで解決）"""
+        st = os.stat(image_path)
+        return _identify(str(image_path), st.st_mtime_ns, st.st_size)
+
+    def get_image_info_batch(self, image_files):
+        """複数画像の情報を identify 1回でまとめて取得（パス文字列 → 情報dict）"""
+        by_name = {}
+        if image_files and self.ensure_imagemagick():
+            try:
+                cmd = ['magick', 'identify', '-format', '%f %w %h %b\\n',
+                       *[str(f) for f in image_files]]
+                result = subprocess.run(cmd, capture_output=True, text=True,
+                                        timeout=10 + len(image_files))
+                if result.returncode == 0:
+                    for line in result.stdout.splitlines():
+                        parts = line.split()
+                        if len(parts) == 4:
+                            by_name[parts[0]] = (int(parts[1]), int(parts[2]), parts[3])
+            except (subprocess.TimeoutExpired, ValueError):
+                pass
+
+        # 一括 identify で取れなかった分は並列でフォールバック取得
+        missing = [f for f in image_files if Path(f).name not in by_name]
+        fallback_infos = {}
+        if missing:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for image_file, info in zip(missing,
+                                            executor.map(self.get_image_info, missing)):
+                    fallback_infos[str(image_file)] = info
+
+        results = {}
+        for image_file in image_files:
+            parsed = by_name.get(Path(image_file).name)
+            if parsed:
+                results[str(image_file)] = {
+                    'width': parsed[0],
+                    'height': parsed[1],
+                    'file_size_str': parsed[2],
+                    'file_size': os.path.getsize(image_file)
                 }
-        except (subprocess.TimeoutExpired, ValueError, IndexError):
-            pass
-        
-        # フォールバック: ファイルサイズのみ
-        return {
-            'width': 0,
-            'height': 0,
-            'file_size_str': 'unknown',
-            'file_size': os.path.getsize(image_path)
-        }
-    
-    def needs_optimization(self, image_path):
-        """最適化が必要かどうか判定"""
-        if not os.path.exists(image_path):
-            return False
-            
-        info = self.get_image_info(image_path)
-        
+            else:
+                results[str(image_file)] = fallback_infos[str(image_file)]
+        return results
+
+
+    def needs_optimization(self, image_path, info=None, size_hint=None):
+        """最適化が必要かどうか判定
+
+        info は取得済みの画像情報があれば再利用。size_hint に scandir 等で
+        取得済みのファイルサイズを渡すと、サイズ超過の判定を stat なしで行う。
+        """
+        checked_key = None
+        if info is None:
+            if size_hint is not None and size_hint > self._max_file_size:
+                return True
+
+            try:
+                st = os.stat(image_path)
+            except OSError:
+                return False
+
+            checked_key = (str(image_path), st.st_mtime_ns, st.st_size)
+            if checked_key in self._recently_checked_ok:
+                return False
+
+            info = _identify(checked_key[0], st.st_mtime_ns, st.st_size)
+
         # ファイルサイズチェック
-        if info['file_size'] > self.settings['max_file_size']:
+        if info['file_size'] > self._max_file_size:
             return True
-            
+
         # 解像度チェック（ImageMagickが利用可能な場合）
         if info['width'] > 0 and info['height'] > 0:
-            if (info['width'] > self.settings['width'] * 1.2 or 
-                info['height'] > self.settings['height'] * 1.2):
+            if info['width'] > self._max_width or info['height'] > self._max_height:
                 return True
-                
+
+        if checked_key is not None:
+            self._recently_checked_ok.add(checked_key)
         return False
     
-    def create_backup(self, image_path):
-        """バックアップファイルを作成"""
+    def create_backup(self, image_path, backup_names=None):
+        """バックアップファイルを作成
+
+        backup_names に取得済みのバックアップ名集合を渡すと、存在確認を
+        syscall なしで済ませ、作成後は集合側も更新する（一括実行用）。
+        """
         if not self.settings['preserve_original']:
             return True
-            
+
         try:
-            self.backup_dir.mkdir(parents=True, exist_ok=True)
-            backup_path = self.backup_dir / Path(image_path).name
-            
-            if not backup_path.exists():
-                import shutil
+            name = Path(image_path).name
+            backup_path = self.backup_dir / name
+
+            if backup_names is not None:
+                if name in backup_names:
+                    return True
+            else:
+                self.backup_dir.mkdir(parents=True, exist_ok=True)
+                if backup_path.exists():
+                    return True
+
+            # ハードリンクならバイトコピー不要。最適化側は os.replace で
+            # 別 inode に置き換えるため、リンク先には元画像がそのまま残る
+            try:
+                os.link(image_path, backup_path)
+            except OSError:
                 shutil.copy2(image_path, backup_path)
-                self.print_safe(f"📁 バックアップ作成: {backup_path.name}")
-            
+            if backup_names is not None:
+                backup_names.add(name)
+            self.print_safe(f"📁 バックアップ作成: {backup_path.name}")
+
             return True
         except Exception as e:
             self.print_safe(f"❌ バックアップ作成エラー: {e}")
             return False
     
-    def optimize_image(self, image_path):
-        """画像を最適化"""
+    def optimize_image(self, image_path, info=None, backup_names=None):
+        """画像を最適化（info / backup_names は取得済みのものがあれば再利用）"""
         if not self.ensure_imagemagick():
             self.print_safe("❌ ImageMagickが見つかりません。最適化をスキップします。")
             return False
-        
+
         if not os.path.exists(image_path):
             self.print_safe(f"❌ ファイルが見つかりません: {image_path}")
             return False
-        
+
         # 最適化が必要かチェック
-        if not self.needs_optimization(image_path):
+        if not self.needs_optimization(image_path, info):
             self.print_safe(f"✅ 最適化不要: {Path(image_path).name}")
             return True
-        
-        original_info = self.get_image_info(image_path)
-        self.print_safe(f"🖼️ 最適化中: {Path(image_path).name}")
-        self.print_safe(f"   元サイズ: {original_info['width']}x{original_info['height']}, "
-                       f"{original_info['file_size'] // 1024}KB")
-        
+
+        original_info = info if info is not None else self.get_image_info(image_path)
+        # ファイルごとの報告は1ブロックにまとめて最後に一度だけ出力する
+        # （並列実行時も他ファイルの出力と混ざらない）
+        report = [
+            f"🖼️ 最適化中: {Path(image_path).name}",
+            f"   元サイズ: {original_info['width']}x{original_info['height']}, "
+            f"{original_info['file_size'] // 1024}KB"
+        ]
+
         # バックアップ作成
-        if not self.create_backup(image_path):
+        if not self.create_backup(image_path, backup_names):
             return False
         
         # 一時ファイル作成
         temp_path = str(image_path) + '.temp'
         
         try:
-            # ImageMagickコマンド実行
-            cmd = [
-                'magick', str(image_path),
-                '-auto-orient',
-                '-strip',
-                '-resize', f"{self.settings['width']}x{self.settings['height']}>",
-                '-quality', str(self.settings['quality']),
-                temp_path
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0 and os.path.exists(temp_path):
+            # まず常駐の magick -script プロセスで変換（プロセス起動なし）
+            converted = self._script_convert(image_path, temp_path)
+            error_detail = ''
+
+            if converted is None:
+                # 常駐プロセスが使えない環境では従来どおり都度起動
+                cmd = [
+                    'magick', *self._decode_defines(image_path), str(image_path),
+                    '-auto-orient',
+                    '-strip',
+                    '-resize', f"{self.settings['width']}x{self.settings['height']}>",
+                    '-quality', str(self.settings['quality']),
+                    temp_path
+                ]
+
+                result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                                        stderr=subprocess.PIPE, timeout=30)
+                converted = result.returncode == 0
+                if not converted:
+                    error_detail = result.stderr.decode('utf-8', errors='replace')
+
+            if converted and os.path.exists(temp_path):
                 # 最適化されたファイルで置き換え
                 os.replace(temp_path, image_path)
-                
+
+                # 最適化済みとして記録し、同一セッション内の再チェックを省く
+                st = os.stat(image_path)
+                self._recently_checked_ok.add((str(image_path), st.st_mtime_ns, st.st_size))
+
                 # 結果表示
                 new_info = self.get_image_info(image_path)
-                reduction = ((original_info['file_size'] - new_info['file_size']) / 
+                reduction = ((original_info['file_size'] - new_info['file_size']) /
                            original_info['file_size'] * 100)
-                
-                self.print_safe(f"   最適化後: {new_info['width']}x{new_info['height']}, "
-                               f"{new_info['file_size'] // 1024}KB")
-                self.print_safe(f"   削減率: {reduction:.1f}%")
-                
+
+                report.append(f"   最適化後: {new_info['width']}x{new_info['height']}, "
+                              f"{new_info['file_size'] // 1024}KB")
+                report.append(f"   削減率: {reduction:.1f}%")
+                self.print_safe('\n'.join(report))
+
                 return True
             else:
-                self.print_safe(f"❌ 最適化失敗: {result.stderr}")
+                report.append(f"❌ 最適化失敗: {error_detail}")
+                self.print_safe('\n'.join(report))
                 if os.path.exists(temp_path):
                     os.remove(temp_path)
                 return False
@@ -177,6 +479,75 @@ class ImageOptimizer:
                 os.remove(temp_path)
             return False
     
+    def _batch_optimize(self, targets, backup_names=None):
+        """magick mogrify でまとめて最適化（プロセス起動1回）
+
+        成功時は (件数, 削減バイト数)、失敗時は None を返す。
+        """
+        original_sizes = {str(f): os.path.getsize(f) for f in targets}
+
+        for image_file in targets:
+            if not self.create_backup(image_file, backup_names):
+                return None
+
+        # -define はフォーマット別なので、同じ引数になるグループごとに実行
+        define_groups = {}
+        for image_file in targets:
+            key = tuple(self._decode_defines(image_file))
+            define_groups.setdefault(key, []).append(image_file)
+
+        try:
+            with tempfile.TemporaryDirectory(dir=str(self.images_dir)) as tmp_dir:
+                for defines, batch in define_groups.items():
+                    cmd = [
+                        'magick', 'mogrify',
+                        '-path', tmp_dir,
+                        *defines,
+                        '-auto-orient',
+                        '-strip',
+                        '-resize', f"{self.settings['width']}x{self.settings['height']}>",
+                        '-quality', str(self.settings['quality']),
+                        *[str(f) for f in batch]
+                    ]
+
+                    result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                                            stderr=subprocess.PIPE,
+                                            timeout=30 + 10 * len(batch))
+                    if result.returncode != 0:
+                        stderr_text = result.stderr.decode('utf-8', errors='replace')
+                        self.print_safe(f"❌ 一括最適化失敗: {stderr_text}")
+                        return None
+
+                optimized_count = 0
+                total_savings = 0
+                for image_file in targets:
+                    temp_path = Path(tmp_dir) / Path(image_file).name
+                    if temp_path.exists():
+                        os.replace(temp_path, image_file)
+                        st = os.stat(image_file)
+                        self._recently_checked_ok.add(
+                            (str(image_file), st.st_mtime_ns, st.st_size))
+                        new_size = st.st_size
+                        total_savings += original_sizes[str(image_file)] - new_size
+                        optimized_count += 1
+                        self.print_safe(f"✅ 最適化完了: {Path(image_file).name} "
+                                       f"({new_size // 1024}KB)")
+
+                return optimized_count, total_savings
+
+        except (subprocess.TimeoutExpired, OSError) as e:
+            self.print_safe(f"❌ 一括最適化エラー: {e}")
+            return None
+
+    def _optimize_one(self, image_file, backup_names=None):
+        """1ファイル分の最適化（並列実行用）。削減バイト数を返す（失敗時は None）"""
+        original_size = os.path.getsize(image_file)
+
+        if self.optimize_image(image_file, backup_names=backup_names):
+            new_size = os.path.getsize(image_file)
+            return original_size - new_size
+        return None
+
     def optimize_all_images(self):
         """すべての画像を最適化"""
         if not self.images_dir.exists():
@@ -184,62 +555,79 @@ class ImageOptimizer:
             return False
         
         image_extensions = ('.jpg', '.jpeg', '.png')
-        image_files = []
-        
-        for ext in image_extensions:
-            image_files.extend(self.images_dir.glob(f"*{ext}"))
-            image_files.extend(self.images_dir.glob(f"*{ext.upper()}"))
-        
-        # バックアップディレクトリの画像は除外
-        image_files = [f for f in image_files if 'backup' not in str(f)]
-        
-        if not image_files:
+
+        # 1回の scandir で列挙し、DirEntry が持つ stat キャッシュを使い回す
+        image_entries = [e for e in os.scandir(self.images_dir)
+                         if e.is_file()
+                         and e.name.lower().endswith(image_extensions)
+                         and 'backup' not in e.path]
+
+        if not image_entries:
             self.print_safe("📝 最適化対象の画像ファイルがありません")
             return True
-        
-        self.print_safe(f"🖼️ {len(image_files)}個の画像ファイルをチェック中...")
-        
+
+        self.print_safe(f"🖼️ {len(image_entries)}個の画像ファイルをチェック中...")
+
         optimized_count = 0
         total_savings = 0
-        
-        for image_file in image_files:
-            if self.needs_optimization(image_file):
-                original_size = os.path.getsize(image_file)
-                
-                if self.optimize_image(image_file):
-                    new_size = os.path.getsize(image_file)
-                    total_savings += (original_size - new_size)
-                    optimized_count += 1
-        
+
+        targets = [e.path for e in image_entries
+                   if self.needs_optimization(e.path, size_hint=e.stat().st_size)]
+        if targets:
+            # バックアップ済みファイル名は1回のディレクトリ読みで把握しておく
+            backup_names = None
+            if self.settings['preserve_original']:
+                self.backup_dir.mkdir(parents=True, exist_ok=True)
+                backup_names = {e.name for e in os.scandir(self.backup_dir)}
+
+            # まずは mogrify の一括実行（プロセス起動1回）を試す
+            batch_result = None
+            if self.ensure_imagemagick():
+                batch_result = self._batch_optimize(targets, backup_names)
+
+            if batch_result is not None:
+                optimized_count, total_savings = batch_result
+            else:
+                # フォールバック: ファイル単位の最適化を並列実行
+                # magick はサブプロセスで動くため GIL を握らない → スレッドプールで並列化
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    futures = {executor.submit(self._optimize_one, f, backup_names): f
+                               for f in targets}
+                    for future in as_completed(futures):
+                        savings = future.result()
+                        if savings is not None:
+                            total_savings += savings
+                            optimized_count += 1
+
         # サマリー表示
         if optimized_count > 0:
-            self.print_safe(f"\n✅ 最適化完了:")
-            self.print_safe(f"   処理ファイル数: {optimized_count}")
-            self.print_safe(f"   削減サイズ: {total_savings // 1024}KB")
+            self.print_safe(f"\n✅ 最適化完了:\n"
+                            f"   処理ファイル数: {optimized_count}\n"
+                            f"   削減サイズ: {total_savings // 1024}KB")
         else:
             self.print_safe("✅ すべての画像が既に最適化されています")
         
         return True
     
-    def check_image_requirements(self, image_path):
-        """画像がサイト要件を満たしているかチェック"""
+    def check_image_requirements(self, image_path, info=None):
+        """画像がサイト要件を満たしているかチェック（info は取得済みなら再利用）"""
         if not os.path.exists(image_path):
             return False, "ファイルが存在しません"
-        
-        info = self.get_image_info(image_path)
+
+        if info is None:
+            info = self.get_image_info(image_path)
         issues = []
         
         # ファイルサイズチェック
-        if info['file_size'] > self.settings['max_file_size']:
+        if info['file_size'] > self._max_file_size:
             issues.append(f"ファイルサイズが大きすぎます ({info['file_size'] // 1024}KB)")
-        
+
         # アスペクト比チェック（ImageMagickが利用可能な場合）
         if info['width'] > 0 and info['height'] > 0:
             aspect_ratio = info['width'] / info['height']
-            target_ratio = self.settings['width'] / self.settings['height']  # 3:4 = 0.75
-            
-            if abs(aspect_ratio - target_ratio) > 0.1:  # 10%以上の差
-                issues.append(f"アスペクト比が推奨値と異なります ({aspect_ratio:.2f}, 推奨: {target_ratio:.2f})")
+
+            if abs(aspect_ratio - self._target_ratio) > 0.1:  # 10%以上の差
+                issues.append(f"アスペクト比が推奨値と異なります ({aspect_ratio:.2f}, 推奨: {self._target_ratio:.2f})")
         
         return len(issues) == 0, "; ".join(issues)
 
@@ -252,7 +640,8 @@ class EnhancedGameAdder:
         self.images_dir = self.docs_dir / "assets" / "images"
         self.downloads_dir = self.docs_dir / "downloads"
         self.is_windows = platform.system() == "Windows"
-        
+        self._games_cache = None  # load_games_data の結果キャッシュ
+
         # 画像最適化クラスを初期化
         self.image_optimizer = ImageOptimizer(self.docs_dir.parent)  # プロジェクトルート
     
@@ -276,28 +665,42 @@ class EnhancedGameAdder:
             dir_path.mkdir(parents=True, exist_ok=True)
     
     def load_games_data(self):
-        """既存のゲームデータを読み込み"""
+        """既存のゲームデータを読み込み（一度読んだ結果はプロセス内で再利用）"""
+        if self._games_cache is not None:
+            return self._games_cache
+
+        data = {'games': []}
         if self.games_yml_path.exists():
             try:
                 with open(self.games_yml_path, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f) or {'games': []}
+                    data = yaml.load(f, Loader=_YamlLoader) or {'games': []}
             except Exception as e:
                 self.print_safe(f"❌ ファイル読み込みエラー: {e}")
                 return {'games': []}
-        return {'games': []}
-    
+
+        self._games_cache = data
+        return data
+
     def save_games_data(self, data):
-        """ゲームデータを保存"""
+        """ゲームデータを保存（バックアップはハードリンク、書き込みはアトミック）"""
         try:
-            # バックアップ作成
+            # バックアップ作成（ハードリンクならバイトコピー不要）
             if self.games_yml_path.exists():
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_path = self.games_yml_path.with_suffix(f'.yml.backup.{timestamp}')
-                import shutil
-                shutil.copy2(str(self.games_yml_path), str(backup_path))
-            
-            with open(self.games_yml_path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+                try:
+                    os.link(self.games_yml_path, backup_path)
+                except OSError:
+                    # 別ファイルシステム等でリンク不可なら従来どおりコピー
+                    shutil.copy2(str(self.games_yml_path), str(backup_path))
+
+            # 一時ファイルに書き切ってから os.replace（途中クラッシュでも壊れない）
+            tmp_path = self.games_yml_path.with_suffix('.yml.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                yaml.dump(data, f, Dumper=_YamlDumper, allow_unicode=True,
+                          default_flow_style=False, sort_keys=False)
+            os.replace(tmp_path, self.games_yml_path)
+            self._games_cache = data
             return True
         except Exception as e:
             self.print_safe(f"❌ ファイル保存エラー: {e}")
@@ -323,9 +726,12 @@ class EnhancedGameAdder:
             self.print_safe(f"    ファイルを {self.images_dir} に配置してください")
             return False
         
+        # 画像情報は1回だけ取得して以降のチェックで使い回す
+        info = self.image_optimizer.get_image_info(image_path)
+
         # 画像要件チェック
-        is_valid, message = self.image_optimizer.check_image_requirements(image_path)
-        
+        is_valid, message = self.image_optimizer.check_image_requirements(image_path, info)
+
         if not is_valid:
             self.print_safe(f"⚠️  画像の問題: {message}")
             
@@ -333,7 +739,7 @@ class EnhancedGameAdder:
             if self.image_optimizer.settings['auto_optimize']:
                 choice = self.safe_input("自動で最適化しますか？ (y/n): ").lower()
                 if choice == 'y':
-                    if self.image_optimizer.optimize_image(image_path):
+                    if self.image_optimizer.optimize_image(image_path, info):
                         self.print_safe("✅ 画像最適化完了")
                         return True
                     else:
@@ -360,7 +766,7 @@ class EnhancedGameAdder:
             return None
         
         # ID生成
-        suggested_id = re.sub(r'[^a-z0-9-]', '', game_data['title'].lower().replace(' ', '-').replace('　', '-'))
+        suggested_id = _ID_SANITIZE_RE.sub('', game_data['title'].lower().translate(_SPACE_TABLE))
         if not suggested_id:
             suggested_id = "new-game"
         
@@ -368,7 +774,7 @@ class EnhancedGameAdder:
         
         # 重複チェック
         existing_data = self.load_games_data()
-        existing_ids = [game.get('id') for game in existing_data.get('games', [])]
+        existing_ids = {game.get('id') for game in existing_data.get('games', [])}
         if game_id in existing_ids:
             self.print_safe(f"❌ ID '{game_id}' は既に使用されています")
             return None
@@ -439,7 +845,7 @@ class EnhancedGameAdder:
             image_path = self.images_dir / game_data['image']
             if image_path.exists():
                 info = self.image_optimizer.get_image_info(image_path)
-                is_optimal = not self.image_optimizer.needs_optimization(image_path)
+                is_optimal = not self.image_optimizer.needs_optimization(image_path, info)
                 status = "✅ 最適" if is_optimal else "⚠️  要最適化"
                 
                 self.print_safe(f"\n🖼️ 画像情報:")
@@ -503,28 +909,36 @@ class EnhancedGameAdder:
     def show_next_steps(self, game_data):
         """次のステップを表示"""
         self.print_safe("\n📝 次のステップ:")
-        
+
+        # ディレクトリごとに1回だけ読み、以降はメモリ上の集合で判定
+        def dir_names(dir_path):
+            try:
+                return {e.name for e in os.scandir(dir_path)}
+            except FileNotFoundError:
+                return set()
+
+        images_present = dir_names(self.images_dir)
+        rules_present = dir_names(self.downloads_dir / "rules")
+        summaries_present = dir_names(self.downloads_dir / "summaries")
+
         steps = []
         step_num = 1
-        
+
         # ファイル配置確認
         if game_data.get('image'):
-            image_path = self.images_dir / game_data['image']
-            if not image_path.exists():
+            if game_data['image'] not in images_present:
                 steps.append(f"{step_num}. 画像ファイル '{game_data['image']}' を docs/assets/images/ に配置")
                 step_num += 1
-        
+
         if game_data.get('rulesUrl'):
             file_path = game_data['rulesUrl'].replace('/', os.sep)
-            full_path = self.docs_dir / file_path[1:]
-            if not full_path.exists():
+            if os.path.basename(game_data['rulesUrl']) not in rules_present:
                 steps.append(f"{step_num}. ルールPDF を docs{file_path} に配置")
                 step_num += 1
-        
+
         if game_data.get('summaryUrl'):
             file_path = game_data['summaryUrl'].replace('/', os.sep)
-            full_path = self.docs_dir / file_path[1:]
-            if not full_path.exists():
+            if os.path.basename(game_data['summaryUrl']) not in summaries_present:
                 steps.append(f"{step_num}. サマリーPDF を docs{file_path} に配置")
                 step_num += 1
         
@@ -558,15 +972,20 @@ def main():
         # 画像チェックのみ実行
         images_dir = adder.images_dir
         if images_dir.exists():
-            image_files = list(images_dir.glob("*.jpg")) + list(images_dir.glob("*.png"))
-            image_files = [f for f in image_files if 'backup' not in str(f)]
+            # glob を重ねず、1回の scandir で大文字小文字も含めて拾う
+            exts = {'.jpg', '.jpeg', '.png'}
+            image_files = [Path(e.path) for e in os.scandir(images_dir)
+                           if e.is_file()
+                           and os.path.splitext(e.name)[1].lower() in exts
+                           and 'backup' not in e.path]
             
             print(f"🖼️ 画像最適化状況チェック ({len(image_files)}ファイル)")
             print("-" * 60)
             
+            infos = adder.image_optimizer.get_image_info_batch(image_files)
             for image_file in image_files:
-                info = adder.image_optimizer.get_image_info(image_file)
-                needs_opt = adder.image_optimizer.needs_optimization(image_file)
+                info = infos[str(image_file)]
+                needs_opt = adder.image_optimizer.needs_optimization(image_file, info)
                 status = "要最適化" if needs_opt else "最適"
                 
                 print(f"{image_file.name:20} {info['width']}x{info['height']:>8} {info['file_size']//1024:>4}KB {status}")
@@ -5,16 +5,52 @@
 ゲームの一覧表示、編集、削除、検索機能を提供
 """
 
-import yaml
 import os
 import sys
 import argparse
 import platform
-import shutil
+from collections import Counter
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
+
+# PyYAML のインポートは起動時間に効くため、--help などデータに触れない
+# 実行経路では読み込まないよう初回利用時まで遅延させる
+_YAML = None
+
+
+def _get_yaml():
+    """(yamlモジュール, Loader, Dumper) を返す（初回のみインポート）"""
+    global _YAML
+    if _YAML is None:
+        import yaml
+        try:
+            # libyaml バインディング（C実装）があれば10倍以上速い
+            # 無い環境は libyaml-dev を入れて pyyaml を再ビルドすると有効になる
+            from yaml import CSafeLoader as loader, CSafeDumper as dumper
+        except ImportError:
+            from yaml import SafeLoader as loader, SafeDumper as dumper
+        _YAML = (yaml, loader, dumper)
+    return _YAML
 
 class GameManager:
+    # インスタンス属性は固定なので __slots__ で __dict__ を持たせない
+    # （list_games 等のループ内での属性アクセスも少し速くなる）
+    __slots__ = (
+        'script_dir', 'docs_dir', 'games_yml_path', 'images_dir',
+        'downloads_dir', 'is_windows', '_cache', '_cache_mtime',
+        '_search_index', '_search_index_data', '_dir_cache',
+        '_path_index', '_path_index_data', '_out_buffer',
+    )
+
+    # 絵文字を表示できない環境向けの代替文字テーブル（str.translate で1パス変換。
+    # 異体字セレクタ U+FE0F は単独で残らないよう除去する）
+    _EMOJI_TABLE = str.maketrans({
+        '🎲': '[GAME]', '🖼': '[IMG]', '✅': '[OK]', '❌': '[ERROR]',
+        '📁': '[FOLDER]', '📝': '[NOTE]', '🔍': '[SEARCH]', '📋': '[LIST]',
+        '⚠': '[WARN]', '📊': '[STATS]', '🗑': '[DEL]', '✏': '[EDIT]',
+        '️': ''
+    })
+
     def __init__(self):
         # scripts フォルダから docs フォルダへのパス
         self.script_dir = Path(__file__).parent  # scripts フォルダ
@@ -23,40 +59,108 @@ class GameManager:
         self.images_dir = self.docs_dir / "assets" / "images"
         self.downloads_dir = self.docs_dir / "downloads"
         self.is_windows = platform.system() == "Windows"
-    
+        self._cache = None  # load_games_data の結果キャッシュ
+        self._cache_mtime = None
+        self._search_index = None  # 小文字化済みの検索用インデックス
+        self._search_index_data = None
+        self._dir_cache = {}  # ディレクトリ走査結果のキャッシュ（存在確認用）
+        self._path_index = None  # ゲームごとの参照ファイル絶対パス（id → dict）
+        self._path_index_data = None
+        self._out_buffer = None  # バッファリング中の print_safe 出力
+
     def print_safe(self, text):
-        """Windows環境での安全な出力"""
+        """Windows環境での安全な出力（バッファリング中は蓄積のみ）"""
+        if self._out_buffer is not None:
+            self._out_buffer.append(text)
+            return
         try:
             print(text)
         except UnicodeEncodeError:
-            safe_text = text.replace('🎲', '[GAME]').replace('🖼️', '[IMG]').replace('✅', '[OK]').replace('❌', '[ERROR]')
-            print(safe_text)
+            print(text.translate(self._EMOJI_TABLE))
+
+    @contextmanager
+    def _buffered_output(self):
+        """ブロック内の print_safe 出力をまとめて1回の write で流す"""
+        if self._out_buffer is not None:
+            # すでにバッファリング中なら外側に任せる
+            yield
+            return
+
+        self._out_buffer = []
+        try:
+            yield
+        finally:
+            text = '\n'.join(self._out_buffer) + '\n'
+            self._out_buffer = None
+            if text != '\n':
+                try:
+                    sys.stdout.write(text)
+                except UnicodeEncodeError:
+                    # 絵文字以外にもエンコードできない文字が混ざっていても
+                    # ブロック全体を失わないよう、代替文字に置換して流す
+                    text = text.translate(self._EMOJI_TABLE)
+                    buffer = getattr(sys.stdout, 'buffer', None)
+                    if buffer is not None:
+                        encoding = sys.stdout.encoding or 'utf-8'
+                        sys.stdout.flush()
+                        buffer.write(text.encode(encoding, errors='replace'))
+                        buffer.flush()
+                    else:
+                        sys.stdout.write(text.encode('ascii', errors='replace')
+                                         .decode('ascii'))
     
     def load_games_data(self):
-        """既存のゲームデータを読み込み"""
+        """既存のゲームデータを読み込み（同一 mtime ならパース済みの結果を再利用）"""
         if not self.games_yml_path.exists():
             self.print_safe("❌ games.yml ファイルが見つかりません")
             return {'games': []}
-        
+
         try:
-            with open(self.games_yml_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {'games': []}
+            st = self.games_yml_path.stat()
+            mtime = st.st_mtime_ns
+            if self._cache is not None and self._cache_mtime == mtime:
+                return self._cache
+
+            if st.st_size < 12:
+                # ほぼ空のファイル（空 or "games:" 程度）はパーサを起動しない
+                data = {'games': []}
+            else:
+                # ファイル全体を一括読みし、連続したバッファをパーサに渡す
+                yaml, yaml_loader, _ = _get_yaml()
+                data = yaml.load(self.games_yml_path.read_bytes(),
+                                 Loader=yaml_loader) or {'games': []}
+
+            self._cache = data
+            self._cache_mtime = mtime
+            return data
         except Exception as e:
             self.print_safe(f"❌ ファイル読み込みエラー: {e}")
             return {'games': []}
     
     def save_games_data(self, data):
-        """ゲームデータを保存"""
+        """ゲームデータを保存（テンポラリ書き込み + os.replace でアトミックに）"""
         try:
-            # バックアップ作成
+            # PyYAML はノード単位で細かい write を多発するため、大きめの
+            # バッファでまとめて書き出す（クローズ時に一括フラッシュ）
+            yaml, _, yaml_dumper = _get_yaml()
+            tmp_path = self.games_yml_path.with_suffix('.yml.tmp')
+            with open(tmp_path, 'w', encoding='utf-8',
+                      buffering=1024 * 1024) as f:
+                yaml.dump(data, f, Dumper=yaml_dumper, allow_unicode=True,
+                          default_flow_style=False, sort_keys=False)
+
+            # 直前の内容は単一の .bak として保持（タイムスタンプ付きコピーの
+            # 量産と毎回のフルコピーをやめ、rename 2回で済ませる）
             if self.games_yml_path.exists():
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_path = self.games_yml_path.with_suffix(f'.yml.backup.{timestamp}')
-                shutil.copy2(str(self.games_yml_path), str(backup_path))
+                backup_path = self.games_yml_path.with_suffix('.yml.bak')
+                os.replace(str(self.games_yml_path), str(backup_path))
                 self.print_safe(f"📁 バックアップ作成: {backup_path.name}")
-            
-            with open(self.games_yml_path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+
+            os.replace(str(tmp_path), str(self.games_yml_path))
+
+            # 書き込んだ内容と食い違わないようキャッシュは破棄して読み直させる
+            self._cache = None
+            self._cache_mtime = None
             return True
         except Exception as e:
             self.print_safe(f"❌ ファイル保存エラー: {e}")
@@ -70,6 +174,47 @@ class GameManager:
             self.print_safe("❌ 入力エラー")
             return ""
     
+    def _dir_names(self, dir_path):
+        """ディレクトリ内のファイル名集合を返す（走査結果はプロセス内キャッシュ）"""
+        key = str(dir_path)
+        cached = self._dir_cache.get(key)
+        if cached is None:
+            try:
+                cached = {e.name for e in os.scandir(dir_path) if e.is_file()}
+            except (FileNotFoundError, NotADirectoryError):
+                cached = set()
+            self._dir_cache[key] = cached
+        return cached
+
+    def _file_exists(self, path):
+        """ファイルの存在確認（ファイルごとの stat ではなくディレクトリ単位の走査1回）"""
+        dir_path, name = os.path.split(str(path))
+        return name in self._dir_names(dir_path)
+
+    def _get_path_index(self):
+        """ゲームごとの参照ファイル絶対パスを事前計算して返す（id → dict）
+
+        表示系のループで Path 連結を毎回やり直さないよう、パース済み
+        データと同じライフサイクルで文字列パスをキャッシュする。
+        """
+        data = self.load_games_data()
+        if self._path_index is None or self._path_index_data is not data:
+            images_dir = str(self.images_dir)
+            docs_dir = str(self.docs_dir)
+            index = {}
+            for game in data.get('games', []):
+                paths = {}
+                if game.get('image'):
+                    paths['image'] = os.path.join(images_dir, game['image'])
+                if game.get('rulesUrl'):
+                    paths['rules'] = os.path.join(docs_dir, *game['rulesUrl'][1:].split('/'))
+                if game.get('summaryUrl'):
+                    paths['summary'] = os.path.join(docs_dir, *game['summaryUrl'][1:].split('/'))
+                index[game.get('id')] = paths
+            self._path_index = index
+            self._path_index_data = data
+        return self._path_index
+
     def list_games(self, show_details=False):
         """登録済みゲーム一覧を表示"""
         data = self.load_games_data()
@@ -79,104 +224,107 @@ class GameManager:
             self.print_safe("📝 登録されているゲームはありません")
             return []
         
-        self.print_safe(f"🎲 登録済みゲーム一覧 ({len(games)}件)")
-        self.print_safe("=" * 80)
-        
-        for i, game in enumerate(games, 1):
-            title = game.get('title', 'タイトル不明')
-            game_id = game.get('id', 'ID不明')
-            players = game.get('players', '?')
-            time = game.get('time', '?')
-            difficulty = game.get('difficultyText', '?')
-            
-            self.print_safe(f"{i:2d}. {title}")
-            
-            if show_details:
-                self.print_safe(f"     ID: {game_id}")
-                self.print_safe(f"     プレイ人数: {players}")
-                self.print_safe(f"     プレイ時間: {time}")
-                self.print_safe(f"     難易度: {difficulty}")
-                
-                if game.get('description'):
-                    desc = game['description']
-                    if len(desc) > 60:
-                        desc = desc[:57] + "..."
-                    self.print_safe(f"     説明: {desc}")
-                
-                # ファイル状況
-                files_status = []
-                if game.get('image'):
-                    image_path = self.images_dir / game['image']
-                    status = "✅" if image_path.exists() else "❌"
-                    files_status.append(f"画像{status}")
-                
-                if game.get('rulesUrl'):
-                    rules_path = self.docs_dir / game['rulesUrl'][1:]
-                    status = "✅" if rules_path.exists() else "❌"
-                    files_status.append(f"ルール{status}")
-                
-                if game.get('summaryUrl'):
-                    summary_path = self.docs_dir / game['summaryUrl'][1:]
-                    status = "✅" if summary_path.exists() else "❌"
-                    files_status.append(f"サマリー{status}")
-                
-                if files_status:
-                    self.print_safe(f"     ファイル: {' | '.join(files_status)}")
-                
-                self.print_safe("")
-            else:
-                self.print_safe(f"     ID: {game_id} | {players} | {time} | {difficulty}")
-        
-        if not show_details:
-            self.print_safe("\n詳細表示: python manage_games.py --list --details")
-        
+        with self._buffered_output():
+            self.print_safe(f"🎲 登録済みゲーム一覧 ({len(games)}件)")
+            self.print_safe("=" * 80)
+
+            for i, game in enumerate(games, 1):
+                title = game.get('title', 'タイトル不明')
+                game_id = game.get('id', 'ID不明')
+                players = game.get('players', '?')
+                time = game.get('time', '?')
+                difficulty = game.get('difficultyText', '?')
+
+                self.print_safe(f"{i:2d}. {title}")
+
+                if show_details:
+                    self.print_safe(f"     ID: {game_id}")
+                    self.print_safe(f"     プレイ人数: {players}")
+                    self.print_safe(f"     プレイ時間: {time}")
+                    self.print_safe(f"     難易度: {difficulty}")
+
+                    if game.get('description'):
+                        desc = game['description']
+                        if len(desc) > 60:
+                            desc = desc[:57] + "..."
+                        self.print_safe(f"     説明: {desc}")
+
+                    # ファイル状況
+                    files_status = []
+                    paths = self._get_path_index().get(game.get('id'), {})
+                    if 'image' in paths:
+                        status = "✅" if self._file_exists(paths['image']) else "❌"
+                        files_status.append(f"画像{status}")
+
+                    if 'rules' in paths:
+                        status = "✅" if self._file_exists(paths['rules']) else "❌"
+                        files_status.append(f"ルール{status}")
+
+                    if 'summary' in paths:
+                        status = "✅" if self._file_exists(paths['summary']) else "❌"
+                        files_status.append(f"サマリー{status}")
+
+                    if files_status:
+                        self.print_safe(f"     ファイル: {' | '.join(files_status)}")
+
+                    self.print_safe("")
+                else:
+                    self.print_safe(f"     ID: {game_id} | {players} | {time} | {difficulty}")
+
+            if not show_details:
+                self.print_safe("\n詳細表示: python manage_games.py --list --details")
+
         return games
     
+    def _get_search_index(self):
+        """検索用に小文字化済みのフィールドを並べたインデックスを返す
+
+        ゲームごとの .lower() をクエリのたびに繰り返さないよう、
+        パース済みデータと同じライフサイクルでキャッシュする。
+        """
+        data = self.load_games_data()
+        if self._search_index is None or self._search_index_data is not data:
+            self._search_index = [
+                (game,
+                 game.get('title', '').lower(),
+                 game.get('id', '').lower(),
+                 game.get('description', '').lower(),
+                 game.get('players', '').lower(),
+                 game.get('difficultyText', '').lower())
+                for game in data.get('games', [])
+            ]
+            self._search_index_data = data
+        return self._search_index
+
     def search_games(self, query):
         """ゲームを検索"""
-        data = self.load_games_data()
-        games = data.get('games', [])
-        
         if not query:
-            return games
-        
+            return self.load_games_data().get('games', [])
+
         query_lower = query.lower()
-        matches = []
-        
-        for game in games:
-            # タイトル、ID、説明で検索
-            searchable_fields = [
-                game.get('title', ''),
-                game.get('id', ''),
-                game.get('description', ''),
-                game.get('players', ''),
-                game.get('difficultyText', '')
-            ]
-            
-            if any(query_lower in field.lower() for field in searchable_fields):
-                matches.append(game)
-        
-        return matches
-    
+
+        # タイトル、ID、説明で検索
+        # or はヒット率の高い順（タイトル→ID→説明→人数→難易度）に並べ、
+        # 先頭で一致したら残りのフィールドは走査しない
+        return [game for game, title, game_id, desc, players, diff
+                in self._get_search_index()
+                if (query_lower in title or query_lower in game_id or
+                    query_lower in desc or query_lower in players or
+                    query_lower in diff)]
+
     def find_game_by_id_or_title(self, query):
         """IDまたはタイトルでゲームを検索（管理操作用）"""
-        data = self.load_games_data()
-        games = data.get('games', [])
-        
+        query_lower = query.lower()
+        index = self._get_search_index()
+
         # 完全一致検索
-        for game in games:
-            if (game.get('id', '').lower() == query.lower() or 
-                game.get('title', '').lower() == query.lower()):
+        for game, title, game_id, _desc, _players, _diff in index:
+            if game_id == query_lower or title == query_lower:
                 return game
-        
+
         # 部分一致検索
-        matches = []
-        for game in games:
-            if (query.lower() in game.get('id', '').lower() or 
-                query.lower() in game.get('title', '').lower()):
-                matches.append(game)
-        
-        return matches
+        return [game for game, title, game_id, _desc, _players, _diff in index
+                if query_lower in game_id or query_lower in title]
     
     def select_game_interactive(self, games, action="選択"):
         """ゲームをインタラクティブに選択"""
@@ -227,19 +375,18 @@ class GameManager:
         # ファイル存在確認
         self.print_safe("\n📁 ファイル状況:")
         
-        if game.get('image'):
-            image_path = self.images_dir / game['image']
-            status = "✅ 存在" if image_path.exists() else "❌ 不在"
+        paths = self._get_path_index().get(game.get('id'), {})
+
+        if 'image' in paths:
+            status = "✅ 存在" if self._file_exists(paths['image']) else "❌ 不在"
             self.print_safe(f"  画像ファイル: {status}")
-        
-        if game.get('rulesUrl'):
-            rules_path = self.docs_dir / game['rulesUrl'][1:]
-            status = "✅ 存在" if rules_path.exists() else "❌ 不在"
+
+        if 'rules' in paths:
+            status = "✅ 存在" if self._file_exists(paths['rules']) else "❌ 不在"
             self.print_safe(f"  ルールPDF:   {status}")
-        
-        if game.get('summaryUrl'):
-            summary_path = self.docs_dir / game['summaryUrl'][1:]
-            status = "✅ 存在" if summary_path.exists() else "❌ 不在"
+
+        if 'summary' in paths:
+            status = "✅ 存在" if self._file_exists(paths['summary']) else "❌ 不在"
             self.print_safe(f"  サマリーPDF: {status}")
     
     def edit_game(self, target_game_query=None):
@@ -302,14 +449,12 @@ class GameManager:
             self.print_safe(f"  {i}. {name}")
         self.print_safe("  0. 編集完了")
         
-        # データ読み込み（最新状態を取得）
+        # list_games で読み込んだものと同じパース済みオブジェクトが
+        # mtime キャッシュから返るため、ここで再パースは発生しない
         data = self.load_games_data()
-        target_index = None
-        for i, game in enumerate(data['games']):
-            if game.get('id') == target_game.get('id'):
-                target_index = i
-                break
-        
+        id_to_index = {g.get('id'): i for i, g in enumerate(data['games'])}
+        target_index = id_to_index.get(target_game.get('id'))
+
         if target_index is None:
             self.print_safe("❌ ゲームデータが見つかりません")
             return False
@@ -420,12 +565,15 @@ class GameManager:
             self.print_safe("❌ キャンセルしました")
             return False
         
-        # 削除実行
+        # 削除実行（load_games_data はキャッシュ済みオブジェクトを返す）
         data = self.load_games_data()
-        original_count = len(data['games'])
-        data['games'] = [g for g in data['games'] if g.get('id') != target_game.get('id')]
-        
-        if len(data['games']) < original_count:
+        target_id = target_game.get('id')
+        idx = next((i for i, g in enumerate(data['games'])
+                    if g.get('id') == target_id), None)
+
+        if idx is not None:
+            # リストを作り直さず、その場で1件だけ取り除く
+            data['games'].pop(idx)
             if self.save_games_data(data):
                 self.print_safe(f"✅ '{target_game.get('title')}' を削除しました")
                 
@@ -443,20 +591,27 @@ class GameManager:
         """削除されたゲームの関連ファイル削除を提案"""
         files_to_check = []
         
-        if game_data.get('image'):
-            image_path = self.images_dir / game_data['image']
-            if image_path.exists():
-                files_to_check.append(('画像', str(image_path)))
-        
-        if game_data.get('rulesUrl'):
-            rules_path = self.docs_dir / game_data['rulesUrl'][1:]
-            if rules_path.exists():
-                files_to_check.append(('ルールPDF', str(rules_path)))
-        
-        if game_data.get('summaryUrl'):
-            summary_path = self.docs_dir / game_data['summaryUrl'][1:]
-            if summary_path.exists():
-                files_to_check.append(('サマリーPDF', str(summary_path)))
+        # 削除保存後はインデックスに載っていないため、その場で組み立てる
+        paths = self._get_path_index().get(game_data.get('id'))
+        if paths is None:
+            paths = {}
+            if game_data.get('image'):
+                paths['image'] = os.path.join(str(self.images_dir), game_data['image'])
+            if game_data.get('rulesUrl'):
+                paths['rules'] = os.path.join(str(self.docs_dir),
+                                              *game_data['rulesUrl'][1:].split('/'))
+            if game_data.get('summaryUrl'):
+                paths['summary'] = os.path.join(str(self.docs_dir),
+                                                *game_data['summaryUrl'][1:].split('/'))
+
+        if 'image' in paths and self._file_exists(paths['image']):
+            files_to_check.append(('画像', paths['image']))
+
+        if 'rules' in paths and self._file_exists(paths['rules']):
+            files_to_check.append(('ルールPDF', paths['rules']))
+
+        if 'summary' in paths and self._file_exists(paths['summary']):
+            files_to_check.append(('サマリーPDF', paths['summary']))
         
         if files_to_check:
             self.print_safe("\n🗑️ 関連ファイルも削除しますか？")
@@ -471,6 +626,8 @@ class GameManager:
                         self.print_safe(f"✅ {file_type}を削除しました")
                     except Exception as e:
                         self.print_safe(f"❌ {file_type}削除エラー: {e}")
+                # 削除でディレクトリ内容が変わったので走査キャッシュを破棄
+                self._dir_cache.clear()
     
     def show_statistics(self):
         """統計情報を表示"""
@@ -481,43 +638,48 @@ class GameManager:
             self.print_safe("📊 統計データがありません")
             return
         
-        self.print_safe("📊 ボードゲームライブラリ統計")
-        self.print_safe("=" * 40)
-        
-        # 基本統計
-        self.print_safe(f"総ゲーム数: {len(games)}")
-        
-        # 難易度別統計
-        difficulty_counts = {}
-        for game in games:
-            diff = game.get('difficultyText', '不明')
-            difficulty_counts[diff] = difficulty_counts.get(diff, 0) + 1
-        
-        self.print_safe("\n難易度別:")
-        for diff, count in sorted(difficulty_counts.items()):
-            percentage = (count / len(games)) * 100
-            self.print_safe(f"  {diff}: {count}件 ({percentage:.1f}%)")
-        
-        # プレイ人数分析
-        player_ranges = []
-        for game in games:
-            players = game.get('players', '')
-            if players:
-                player_ranges.append(players)
-        
-        if player_ranges:
-            self.print_safe(f"\nプレイ人数パターン: {len(set(player_ranges))}種類")
-            
-        # ファイル存在統計
-        image_count = sum(1 for game in games if game.get('image') and 
-                         (self.images_dir / game['image']).exists())
-        rules_count = sum(1 for game in games if game.get('rulesUrl'))
-        summary_count = sum(1 for game in games if game.get('summaryUrl'))
-        
-        self.print_safe(f"\nファイル統計:")
-        self.print_safe(f"  画像ファイル: {image_count}/{len(games)} ({(image_count/len(games)*100):.1f}%)")
-        self.print_safe(f"  ルールPDF:   {rules_count}/{len(games)} ({(rules_count/len(games)*100):.1f}%)")
-        self.print_safe(f"  サマリーPDF: {summary_count}/{len(games)} ({(summary_count/len(games)*100):.1f}%)")
+        with self._buffered_output():
+            self.print_safe("📊 ボードゲームライブラリ統計")
+            self.print_safe("=" * 40)
+
+            # 基本統計
+            self.print_safe(f"総ゲーム数: {len(games)}")
+
+            # 1回の走査で難易度・プレイ人数・ファイル統計をまとめて集計
+            difficulty_counts = Counter()
+            player_ranges = set()
+            image_count = 0
+            rules_count = 0
+            summary_count = 0
+
+            path_index = self._get_path_index()
+            for game in games:
+                difficulty_counts[game.get('difficultyText', '不明')] += 1
+
+                players = game.get('players', '')
+                if players:
+                    player_ranges.add(players)
+
+                image_path = path_index.get(game.get('id'), {}).get('image')
+                if image_path and self._file_exists(image_path):
+                    image_count += 1
+                if game.get('rulesUrl'):
+                    rules_count += 1
+                if game.get('summaryUrl'):
+                    summary_count += 1
+
+            self.print_safe("\n難易度別:")
+            for diff, count in sorted(difficulty_counts.items()):
+                percentage = (count / len(games)) * 100
+                self.print_safe(f"  {diff}: {count}件 ({percentage:.1f}%)")
+
+            if player_ranges:
+                self.print_safe(f"\nプレイ人数パターン: {len(player_ranges)}種類")
+
+            self.print_safe(f"\nファイル統計:")
+            self.print_safe(f"  画像ファイル: {image_count}/{len(games)} ({(image_count/len(games)*100):.1f}%)")
+            self.print_safe(f"  ルールPDF:   {rules_count}/{len(games)} ({(rules_count/len(games)*100):.1f}%)")
+            self.print_safe(f"  サマリーPDF: {summary_count}/{len(games)} ({(summary_count/len(games)*100):.1f}%)")
 
 
 def main():
@@ -11,16 +11,23 @@
 """
 
 import yaml
+try:
+    # libyaml バインディング（C実装）があれば10倍以上速い
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 import os
 import sys
-import argparse
 import re
-import platform
+import types
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
 # Windows環境での文字化け対策
-if platform.system() == "Windows":
+# （platform.system() は subprocess 等を巻き込む重いインポートになるため
+#   定数 sys.platform で判定する）
+if sys.platform == "win32":
     import locale
     try:
         # Windows のコンソールエンコーディングを UTF-8 に設定
@@ -29,7 +36,45 @@ if platform.system() == "Windows":
     except:
         pass
 
+# ID 生成用（モジュール読み込み時に1回だけコンパイル）
+_ID_SANITIZE_RE = re.compile(r'[^a-z0-9-]')
+_TITLE_TRANS = str.maketrans({' ': '-', '　': '-'})
+
+# 固定フォーマットの区切り線（毎回組み立てない）
+_HDR_SEP = '=' * 50
+
+# 難易度の選択肢（呼び出しごとに辞書を作り直さない読み取り専用定数）
+_DIFFICULTY_MAP = types.MappingProxyType({
+    '1': ('beginner', '初心者向け'),
+    '2': ('intermediate', '経験者向け'),
+    '3': ('expert', 'エキスパート向け')
+})
+_DIFFICULTY_CHOICES = tuple(_DIFFICULTY_MAP)
+_DIFFICULTY_PROMPT = '\n難易度を選択:\n' + '\n'.join(
+    f"  {key}: {text}" for key, (_, text) in _DIFFICULTY_MAP.items())
+
+
 class GameAdder:
+    # インスタンス属性は固定なので __slots__ で __dict__ を持たせない
+    __slots__ = ('script_dir', 'games_yml_path', 'images_dir',
+                 'downloads_dir', 'is_windows', '_present', '_missing',
+                 '_dir_names', '_cache', '_cache_mtime', '_suggest_cache')
+
+    # ID形式チェック用（クラスで1回だけコンパイル）
+    _ID_RE = re.compile(r'^[a-z0-9-]+$')
+
+    # ファイル参照フィールドと表示ラベル（検証・プレビュー・次ステップ共通）
+    _FILE_FIELDS = (('image', '画像'), ('rulesUrl', 'ルール'),
+                    ('summaryUrl', 'サマリー'))
+
+    # 絵文字を表示できない環境向けの代替文字テーブル（str.translate で1パス変換。
+    # 異体字セレクタ U+FE0F は単独で残らないよう除去する）
+    _EMOJI_TABLE = str.maketrans({
+        '🎲': '[GAME]', '📋': '[LIST]', '✅': '[OK]', '❌': '[ERROR]',
+        '⚠': '[WARN]', '📁': '[FOLDER]', '📝': '[NOTE]', '🔍': '[SEARCH]',
+        '📚': '[BOOKS]', '️': ''
+    })
+
     def __init__(self):
         self.script_dir = Path(__file__).parent.parent  # docs/scripts/ から docs/ へ
         self.games_yml_path = self.script_dir / "_data" / "games.yml"
@@ -37,17 +82,55 @@ class GameAdder:
         self.downloads_dir = self.script_dir / "downloads"
         
         # Windows環境チェック
-        self.is_windows = platform.system() == "Windows"
-        
+        self.is_windows = sys.platform == "win32"
+
+        # check_file_exists の結果キャッシュ（同じパスを何度も stat しない）。
+        # 追加直後は「まだ無い」ファイルを繰り返し確認するため、
+        # 否定結果もファイルシステムの negative dentry よろしく明示的に覚える
+        self._present = set()
+        self._missing = set()
+        self._dir_names = None  # 既知ディレクトリの一括スキャン結果
+        self._cache = None  # load_games_data の結果キャッシュ
+        self._cache_mtime = None
+        self._suggest_cache = {}  # suggest_files の結果キャッシュ（game_id 単位）
+
     def print_with_encoding(self, text):
         """Windows環境での安全な出力"""
         try:
             print(text)
         except UnicodeEncodeError:
             # 絵文字が表示できない場合は代替文字を使用
-            safe_text = text.replace('🎲', '[GAME]').replace('📋', '[LIST]').replace('✅', '[OK]').replace('❌', '[ERROR]').replace('⚠️', '[WARN]').replace('📁', '[FOLDER]').replace('📝', '[NOTE]').replace('🔍', '[SEARCH]')
-            print(safe_text)
+            print(text.translate(self._EMOJI_TABLE))
     
+    def _emit_block(self, lines):
+        """複数行をまとめて1回の write で出力する（行ごとの print を避ける）
+
+        ブロック全体を1回だけエンコードし、バイト列を直接書き出す。
+        絵文字を表示できないエンコーディングでは代替文字に変換する。
+        """
+        text = '\n'.join(lines) + '\n'
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            # StringIO などバイト層を持たない出力先へのフォールバック
+            try:
+                sys.stdout.write(text)
+            except UnicodeEncodeError:
+                sys.stdout.write(text.translate(self._EMOJI_TABLE))
+            return
+
+        encoding = sys.stdout.encoding or 'utf-8'
+        try:
+            payload = text.encode(encoding)
+        except UnicodeEncodeError:
+            payload = text.translate(self._EMOJI_TABLE).encode(encoding,
+                                                               errors='replace')
+        sys.stdout.flush()  # print 済みテキストとの順序を保つ
+        buffer.write(payload)
+        buffer.flush()
+
+    # プロセス内で作成確認済みのディレクトリ（再実行時の stat を省く）
+    _ENSURED = set()
+
     def ensure_directories(self):
         """必要なディレクトリを作成"""
         dirs_to_create = [
@@ -55,42 +138,92 @@ class GameAdder:
             self.downloads_dir / "rules",
             self.downloads_dir / "summaries"
         ]
-        
+
+        created = False
         for dir_path in dirs_to_create:
+            key = str(dir_path)
+            if key in self._ENSURED:
+                continue
+            # exist_ok=True なので存在確認の stat は mkdir に任せる
             dir_path.mkdir(parents=True, exist_ok=True)
-            if not dir_path.exists():
-                self.print_with_encoding(f"📁 ディレクトリを作成しました: {dir_path}")
-        
+            self._ENSURED.add(key)
+            created = True
+
+        if created:
+            # ディレクトリ作成で存在状況が変わり得るのでキャッシュを破棄
+            self._present.clear()
+            self._missing.clear()
+            self._dir_names = None
+
     def load_games_data(self):
-        """既存のゲームデータを読み込み"""
+        """既存のゲームデータを読み込み（同一 mtime ならパース済みの結果を再利用）
+
+        追加フローでは ID 重複チェックと追記で2回呼ばれるため、
+        ファイルが変わっていなければ2回目以降はパースしない。
+        """
         if self.games_yml_path.exists():
             try:
-                with open(self.games_yml_path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
-                    return data or {'games': []}
+                mtime = self.games_yml_path.stat().st_mtime_ns
+                if self._cache is not None and self._cache_mtime == mtime:
+                    return self._cache
+
+                # ファイル全体を一括読みし、連続したバッファをパーサに渡す
+                data = yaml.load(self.games_yml_path.read_bytes(),
+                                 Loader=_YamlLoader) or {'games': []}
+                self._cache = data
+                self._cache_mtime = mtime
+                return data
             except Exception as e:
                 self.print_with_encoding(f"❌ ファイル読み込みエラー: {e}")
                 return {'games': []}
         return {'games': []}
     
     def save_games_data(self, data):
-        """ゲームデータを保存（バックアップ付き）"""
+        """ゲームデータを保存（バックアップ付き・アトミック差し替え）"""
         try:
-            # バックアップ作成
-            if self.games_yml_path.exists():
+            # ストリームに細かい write を多発させず、ダンプ結果を一度
+            # bytes に確定してから1回の write で書き出す
+            payload = yaml.dump(data, Dumper=_YamlDumper, allow_unicode=True,
+                                default_flow_style=False,
+                                sort_keys=False).encode('utf-8')
+
+            try:
+                # 内容が変わっていなければ書き込みもバックアップも省略
+                if self.games_yml_path.read_bytes() == payload:
+                    self.print_with_encoding(f"✅ {self.games_yml_path} は変更ありません")
+                    return True
+
+                # バックアップ作成
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_path = self.games_yml_path.with_suffix(f'.yml.backup.{timestamp}')
-                
+
                 # Windows環境での安全なファイルコピー
                 import shutil
                 shutil.copy2(str(self.games_yml_path), str(backup_path))
                 self.print_with_encoding(f"📁 バックアップ作成: {backup_path.name}")
-            
-            # データ保存
-            with open(self.games_yml_path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+            except FileNotFoundError:
+                pass  # 初回保存（元ファイルなし）
+
+            # データ保存（テンポラリに書いてから os.replace で差し替え、
+            # 途中で落ちても中途半端なファイルを残さない）
+            tmp_path = self.games_yml_path.with_suffix('.yml.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.games_yml_path)
             self.print_with_encoding(f"✅ {self.games_yml_path} を更新しました")
-            
+            # 書き込み後は存在チェック結果を信用しない
+            self._present.clear()
+            self._missing.clear()
+            self._dir_names = None
+
+            # 保存した内容をそのままキャッシュとして引き継ぐ
+            try:
+                self._cache = data
+                self._cache_mtime = self.games_yml_path.stat().st_mtime_ns
+            except OSError:
+                self._cache = None
+                self._cache_mtime = None
+
         except Exception as e:
             self.print_with_encoding(f"❌ ファイル保存エラー: {e}")
             return False
@@ -98,12 +231,13 @@ class GameAdder:
     
     def validate_id(self, game_id):
         """IDの形式をチェック"""
-        if not re.match(r'^[a-z0-9-]+$', game_id):
-            return False, "IDは英小文字、数字、ハイフンのみ使用可能です"
-        if game_id.startswith('-') or game_id.endswith('-'):
-            return False, "IDの最初と最後にハイフンは使用できません"
-        if len(game_id) < 2:
+        # 長さ・端ハイフンの安価な判定を先に済ませ、正規表現は最後に回す
+        if not game_id or len(game_id) < 2:
             return False, "IDは2文字以上で入力してください"
+        if game_id[0] == '-' or game_id[-1] == '-':
+            return False, "IDの最初と最後にハイフンは使用できません"
+        if not self._ID_RE.match(game_id):
+            return False, "IDは英小文字、数字、ハイフンのみ使用可能です"
         return True, ""
     
     def safe_input(self, prompt):
@@ -143,16 +277,44 @@ class GameAdder:
                 self.print_with_encoding("❌ 必須項目です。入力してください。")
     
     def suggest_files(self, game_id):
-        """ファイル名を提案"""
-        suggestions = {
-            'image': f"{game_id}.jpg",
-            'rules': f"/downloads/rules/{game_id}-rules.pdf",
-            'summary': f"/downloads/summaries/{game_id}-summary.pdf"
-        }
+        """ファイル名を提案（game_id ごとに1回だけ組み立てる）"""
+        suggestions = self._suggest_cache.get(game_id)
+        if suggestions is None:
+            suggestions = {
+                'image': f"{game_id}.jpg",
+                'rules': f"/downloads/rules/{game_id}-rules.pdf",
+                'summary': f"/downloads/summaries/{game_id}-summary.pdf"
+            }
+            self._suggest_cache[game_id] = suggestions
         return suggestions
     
+    def _scan_asset_dirs(self):
+        """参照先ディレクトリを一括スキャンし、存在ファイル名の集合を返す
+
+        ゲームごとに1ファイルずつ stat する代わりに、画像・ルール・サマリー
+        の3ディレクトリを os.scandir で1回ずつ読み、以降はメモリ上の
+        集合への所属チェックだけで済ませる。
+        """
+        if self._dir_names is None:
+            names = {}
+            for dir_path in (self.images_dir,
+                             self.downloads_dir / "rules",
+                             self.downloads_dir / "summaries"):
+                try:
+                    with os.scandir(dir_path) as it:
+                        names[str(dir_path)] = {entry.name for entry in it}
+                except (FileNotFoundError, NotADirectoryError):
+                    names[str(dir_path)] = set()
+            self._dir_names = names
+        return self._dir_names
+
     def check_file_exists(self, file_path):
-        """ファイルの存在をチェック"""
+        """ファイルの存在をチェック（1実行内では同じパスを再 stat しない）"""
+        if file_path in self._present:
+            return True
+        if file_path in self._missing:
+            return False
+
         try:
             if file_path.startswith('/downloads/'):
                 full_path = self.downloads_dir / file_path[11:]  # "/downloads/" を除去
@@ -160,9 +322,25 @@ class GameAdder:
                 full_path = self.images_dir / file_path
             else:
                 return False
-            return full_path.exists()
+
+            # 既知ディレクトリ配下ならスキャン済み集合で判定
+            parent, name = os.path.split(str(full_path))
+            dir_names = self._scan_asset_dirs()
+            if parent in dir_names:
+                exists = name in dir_names[parent]
+            else:
+                # Path.exists() は内部で例外を握り潰す分のオーバーヘッドが
+                # あるため、os.stat を直接呼んで失敗時のみ False にする
+                try:
+                    os.stat(full_path)
+                    exists = True
+                except OSError:
+                    exists = False
         except Exception:
-            return False
+            exists = False
+
+        (self._present if exists else self._missing).add(file_path)
+        return exists
     
     def list_games(self):
         """既存ゲーム一覧を表示"""
@@ -194,10 +372,13 @@ class GameAdder:
         self.print_with_encoding("🔍 データ検証を実行中...")
         errors = []
         warnings = []
+
+        # ファイル存在チェックに先立って参照先ディレクトリを一括スキャン
+        self._scan_asset_dirs()
         
-        # 重複IDチェック
-        ids = [game.get('id') for game in games if game.get('id')]
-        duplicates = set([x for x in ids if ids.count(x) > 1])
+        # 重複IDチェック（Counter で1パス、O(N)）
+        id_counts = Counter(game.get('id') for game in games if game.get('id'))
+        duplicates = [game_id for game_id, count in id_counts.items() if count > 1]
         if duplicates:
             errors.append(f"重複ID: {', '.join(duplicates)}")
         
@@ -212,41 +393,38 @@ class GameAdder:
                     errors.append(f"{game_id}: 必須フィールド '{field}' が未設定")
             
             # ファイル存在チェック
-            if game.get('image'):
-                if not self.check_file_exists(game['image']):
-                    warnings.append(f"{game_id}: 画像ファイル '{game['image']}' が見つかりません")
-            
-            for url_field in ['rulesUrl', 'summaryUrl']:
-                if game.get(url_field) and not self.check_file_exists(game[url_field]):
-                    warnings.append(f"{game_id}: ファイル '{game[url_field]}' が見つかりません")
-        
-        # 結果表示
+            for field, _label in self._FILE_FIELDS:
+                value = game.get(field)
+                if value and not self.check_file_exists(value):
+                    if field == 'image':
+                        warnings.append(f"{game_id}: 画像ファイル '{value}' が見つかりません")
+                    else:
+                        warnings.append(f"{game_id}: ファイル '{value}' が見つかりません")
+        
+        # 結果表示（1ブロックにまとめて出力）
+        report = []
         if errors:
-            self.print_with_encoding("❌ エラー:")
-            for error in errors:
-                self.print_with_encoding(f"   {error}")
-        
+            report.append("❌ エラー:")
+            report.extend(f"   {error}" for error in errors)
+
         if warnings:
-            self.print_with_encoding("⚠️  警告:")
-            for warning in warnings:
-                self.print_with_encoding(f"   {warning}")
-        
-        if not errors and not warnings:
-            self.print_with_encoding("✅ データ検証完了 - 問題ありません")
-        
+            report.append("⚠️  警告:")
+            report.extend(f"   {warning}" for warning in warnings)
+
+        if not report:
+            report.append("✅ データ検証完了 - 問題ありません")
+
+        self._emit_block(report)
         return len(errors) == 0
     
     def add_new_game(self):
         """新しいゲームを追加"""
         self.print_with_encoding("🎲 新しいボードゲームを追加します\n")
-        
-        # 基本情報の入力
-        game_data = {}
-        
+
         # ID（自動生成またはカスタム）
         title = self.get_user_input("ゲーム名: ")
         # Windows環境での安全な文字列処理
-        suggested_id = re.sub(r'[^a-z0-9-]', '', title.lower().replace(' ', '-').replace('　', '-'))
+        suggested_id = _ID_SANITIZE_RE.sub('', title.lower().translate(_TITLE_TRANS))
         if not suggested_id:
             suggested_id = "new-game"
             
@@ -256,42 +434,28 @@ class GameAdder:
             validator=self.validate_id
         ) or suggested_id
         
-        # 既存IDチェック
+        # 既存IDチェック（集合なので再入力のたびの判定も O(1)）
         existing_data = self.load_games_data()
-        existing_ids = [game.get('id') for game in existing_data.get('games', [])]
-        if game_id in existing_ids:
+        existing_ids = {game.get('id') for game in existing_data.get('games', ())}
+        while game_id in existing_ids:
             self.print_with_encoding(f"❌ ID '{game_id}' は既に使用されています")
             game_id = self.get_user_input("別のIDを入力してください: ", validator=self.validate_id)
         
-        game_data['id'] = game_id
-        game_data['title'] = title
-        
         # ファイル名提案
         suggestions = self.suggest_files(game_id)
-        
+
         # その他の情報
-        game_data['players'] = self.get_user_input("プレイ人数 (例: 2-4人): ")
-        game_data['time'] = self.get_user_input("プレイ時間 (例: 30-60分): ")
-        game_data['age'] = self.get_user_input("対象年齢 (例: 10歳以上): ")
+        players = self.get_user_input("プレイ人数 (例: 2-4人): ")
+        play_time = self.get_user_input("プレイ時間 (例: 30-60分): ")
+        age = self.get_user_input("対象年齢 (例: 10歳以上): ")
         
         # 難易度
-        difficulty_map = {
-            '1': ('beginner', '初心者向け'),
-            '2': ('intermediate', '経験者向け'),
-            '3': ('expert', 'エキスパート向け')
-        }
-        
-        self.print_with_encoding("\n難易度を選択:")
-        for key, (_, text) in difficulty_map.items():
-            self.print_with_encoding(f"  {key}: {text}")
-        
-        diff_choice = self.get_user_input("選択 (1-3): ", choices=['1', '2', '3'])
-        game_data['difficulty'] = difficulty_map[diff_choice][0]
-        game_data['difficultyText'] = difficulty_map[diff_choice][1]
-        
+        self.print_with_encoding(_DIFFICULTY_PROMPT)
+        diff_choice = self.get_user_input("選択 (1-3): ", choices=_DIFFICULTY_CHOICES)
+        difficulty, difficulty_text = _DIFFICULTY_MAP[diff_choice]
+
         # 説明文
         description = self.get_user_input("ゲームの説明: ")
-        game_data['description'] = description
         
         # ファイル名（提案付き）
         self.print_with_encoding(f"\n📁 ファイル設定（推奨値が表示されます）")
@@ -300,8 +464,6 @@ class GameAdder:
             f"画像ファイル名 [{suggestions['image']}]: ", 
             required=False
         ) or suggestions['image']
-        if image_file:
-            game_data['image'] = image_file
         
         # PDFファイルパス
         rules_url = self.get_user_input(
@@ -314,32 +476,38 @@ class GameAdder:
             required=False
         ) or suggestions['summary']
         
-        game_data['rulesUrl'] = rules_url
-        game_data['summaryUrl'] = summary_url
-        
-        return game_data
+        # 最後に辞書リテラルで一括構築（途中でのリサイズを避ける）
+        return {
+            'id': game_id,
+            'title': title,
+            'players': players,
+            'time': play_time,
+            'age': age,
+            'difficulty': difficulty,
+            'difficultyText': difficulty_text,
+            'description': description,
+            'image': image_file,
+            'rulesUrl': rules_url,
+            'summaryUrl': summary_url,
+        }
     
     def preview_game(self, game_data):
         """追加予定のゲーム情報をプレビュー"""
-        self.print_with_encoding("\n" + "="*50)
-        self.print_with_encoding("📋 追加予定のゲーム情報:")
-        self.print_with_encoding("="*50)
-        for key, value in game_data.items():
-            self.print_with_encoding(f"{key:15}: {value}")
-        self.print_with_encoding("="*50)
-        
+        lines = ["\n" + _HDR_SEP,
+                 "📋 追加予定のゲーム情報:",
+                 _HDR_SEP]
+        lines.extend(f"{key:15}: {value}" for key, value in game_data.items())
+        lines.append(_HDR_SEP)
+
         # ファイル存在チェック
-        self.print_with_encoding("\n📁 ファイル存在チェック:")
-        if game_data.get('image'):
-            exists = self.check_file_exists(game_data['image'])
-            status = "✅ 存在" if exists else "❌ 未配置"
-            self.print_with_encoding(f"   画像: {status}")
-        
-        for field, label in [('rulesUrl', 'ルール'), ('summaryUrl', 'サマリー')]:
-            if game_data.get(field):
-                exists = self.check_file_exists(game_data[field])
-                status = "✅ 存在" if exists else "❌ 未配置"
-                self.print_with_encoding(f"   {label}: {status}")
+        lines.append("\n📁 ファイル存在チェック:")
+        for field, label in self._FILE_FIELDS:
+            value = game_data.get(field)
+            if value:
+                status = "✅ 存在" if self.check_file_exists(value) else "❌ 未配置"
+                lines.append(f"   {label}: {status}")
+
+        self._emit_block(lines)
     
     def run_add_game(self):
         """ゲーム追加のメイン処理"""
@@ -383,33 +551,44 @@ class GameAdder:
     
     def show_next_steps(self, game_data):
         """次に行うべき作業を表示"""
-        self.print_with_encoding("\n📝 次のステップ:")
-        
-        steps = []
-        if game_data.get('image') and not self.check_file_exists(game_data['image']):
-            steps.append(f"1. 画像ファイル '{game_data['image']}' を docs\\assets\\images\\ に配置")
-        
-        if game_data.get('rulesUrl') and not self.check_file_exists(game_data['rulesUrl']):
-            file_path = game_data['rulesUrl'].replace('/', '\\')
-            steps.append(f"2. ルールPDF を docs{file_path} に配置")
-        
-        if game_data.get('summaryUrl') and not self.check_file_exists(game_data['summaryUrl']):
-            file_path = game_data['summaryUrl'].replace('/', '\\')
-            steps.append(f"3. サマリーPDF を docs{file_path} に配置")
-        
-        steps.extend([
-            f"{len(steps)+1}. git add, commit, push でサイトを更新",
-            f"{len(steps)+2}. ローカルで確認: bundle exec jekyll serve"
-        ])
-        
-        for step in steps:
-            self.print_with_encoding(f"   {step}")
+        # 未配置のファイルだけ拾い、番号は enumerate で振り直す
+        # （存在チェックはスキャン済み集合を参照するので追加の stat は出ない）
+        missing = []
+        for field, label in self._FILE_FIELDS:
+            value = game_data.get(field)
+            if not value or self.check_file_exists(value):
+                continue
+            if field == 'image':
+                images_dir = os.path.join('docs', 'assets', 'images', '')
+                missing.append(f"画像ファイル '{value}' を {images_dir} に配置")
+            else:
+                # 手動の '\\' 置換ではなく OS のセパレータで正規化する
+                file_path = os.path.join('docs', os.path.normpath(value.lstrip('/')))
+                missing.append(f"{label}PDF を {file_path} に配置")
+
+        steps = [f"{i}. {text}" for i, text in enumerate(missing, 1)]
+        steps.append(f"{len(steps)+1}. git add, commit, push でサイトを更新")
+        steps.append(f"{len(steps)+1}. ローカルで確認: bundle exec jekyll serve")
+
+        self._emit_block(["\n📝 次のステップ:"] + [f"   {step}" for step in steps])
 
 def main():
     # Windows環境での文字化け対策
-    if platform.system() == "Windows":
+    # stdout が既に UTF-8 ならシェル起動（chcp）のコストを払わない
+    if (sys.platform == "win32" and
+            (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8', 'cp65001')):
         os.system('chcp 65001 >nul 2>&1')  # UTF-8に設定
-    
+
+    # 引数なし（デフォルトの追加フロー）では argparse の構築ごと省略する
+    if len(sys.argv) == 1:
+        try:
+            GameAdder().run_add_game()
+        except Exception as e:
+            print(f"Fatal error: {e}")
+            sys.exit(1)
+        return
+
+    import argparse
     parser = argparse.ArgumentParser(description='ボードゲームライブラリ管理ツール')
     parser.add_argument('--list', action='store_true', help='既存ゲーム一覧を表示')
     parser.add_argument('--validate', action='store_true', help='データ検証を実行')